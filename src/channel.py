@@ -0,0 +1,45 @@
+import asyncio
+from asyncio import Future
+from asyncio.queues import QueueEmpty, QueueFull
+from collections import deque
+from typing import Deque, Optional
+
+
+# single-consumer queue: a deque plus one future the consumer parks on,
+# resolved by the producer only on the empty -> non-empty transition.
+# once `maxsize` items are pending new items are rejected with `QueueFull`
+class Channel[T]:
+    def __init__(self, maxsize: int = 0):
+        self._maxsize = maxsize
+        self._items: Deque[T] = deque()
+        self._waiter: Optional[Future[None]] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= len(self._items)
+
+    def put_nowait(self, item: T) -> None:
+        if self.full():
+            raise QueueFull
+        self._items.append(item)
+        if (waiter := self._waiter) is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def get_nowait(self) -> T:
+        if not self._items:
+            raise QueueEmpty
+        return self._items.popleft()
+
+    async def get(self) -> T:
+        while not self._items:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._items.popleft()
@@ -1,8 +1,9 @@
 import asyncio
-from asyncio import Queue
+import time
 from asyncio.queues import QueueFull
 from dataclasses import dataclass, replace
-from typing import Callable, List, Literal, Optional, Tuple
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
 import websockets
 from pydantic import ValidationError
@@ -14,11 +15,13 @@ from textual.containers import Grid
 from textual.events import Key
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import DataTable, Footer, Header, Label, Select
 from websockets.exceptions import ConnectionClosed
 
 import dtos
+from channel import Channel
 from message import (
     ArbitrageMatrix,
     ClientMsg,
@@ -43,59 +46,71 @@ from widgets import (
     FileBar,
     FileInput,
     PeriodCell,
-    Point,
     QuotesPlot,
     RateSelect,
 )
 
 
-@dataclass(frozen=True)
-class ToastMessage:
-    msg: str
-    severity: Literal["error", "warning", "information"]
+PING_FRAME: bytes = client_msg_adapter.dump_json(Ping())
+
+
+class ErrorRateLimiter:
+    def __init__(self, window: float = 1.0, max_per_window: int = 5):
+        self._window = window
+        self._max = max_per_window
+        self._seen: Dict[Hashable, Tuple[float, int]] = {}
+
+    def allow(self, key: Hashable) -> bool:
+        now = time.monotonic()
+        start, count = self._seen.get(key, (now, 0))
+        if now - start >= self._window:
+            start, count = now, 0
+        self._seen[key] = (start, count + 1)
+        return count < self._max
+
+
+error_limiter = ErrorRateLimiter()
 
 
 async def ws_async(
-    q_in: Queue[ServerMsg], q_out: Queue[ClientMsg], q_toast: Queue[ToastMessage]
+    on_msg: Callable[[ServerMsg], None],
+    q_out: Channel[bytes],
+    warn: Callable[[str], None],
 ) -> None:
-    async with websockets.connect(settings.server_ws_url) as ws:
+    async with websockets.connect(
+        settings.server_ws_url,
+        ping_interval=settings.ws_heartbeat_seconds,
+        ping_timeout=settings.ws_ping_timeout_seconds,
+        max_queue=None,
+        max_size=settings.ws_max_message_bytes,
+        compression="deflate" if settings.ws_compression else None,
+    ) as ws:
 
         async def on_connection_closed(e: ConnectionClosed):
             err = "ws connection closed"
             log.error(f"{err}: {e}")
-            await q_toast.put(ToastMessage(err, "warning"))
+            warn(err)
 
         async def on_exception(e: Exception, msg: str):
             log.error(f"{msg}: {e}")
-            await q_toast.put(ToastMessage(msg, "warning"))
+            warn(msg)
 
         async def on_exception_group(e: ExceptionGroup, msg: str):
             log.error(f"{msg}: {e.exceptions}")
-            await q_toast.put(ToastMessage(msg, "warning"))
-
-        async def send_heartbeat():
-            while True:
-                try:
-                    await ws.send(client_msg_adapter.dump_json(Ping()), text=True)
-                    log.debug("sent ping")
-                    await asyncio.sleep(settings.ws_heartbeat_seconds)
-                except PydanticSerializationError as e:
-                    log.error(f"failed to serialize ping message: {e}")
-                except ConnectionClosed as e:
-                    await on_connection_closed(e)
-                    break
-                except Exception as e:
-                    await on_exception(e, "sending heartbeat failed")
-                    break
+            warn(msg)
 
         async def send_loop():
+            get, get_nowait, send = q_out.get, q_out.get_nowait, ws.send
+            debug = log.debug
+            batch_size = settings.ws_send_batch_size
             while True:
                 try:
-                    msg = await q_out.get()
-                    await ws.send(client_msg_adapter.dump_json(msg), text=True)
-                    log.debug(f"sent ws message: {msg}")
-                except PydanticSerializationError as e:
-                    log.error(f"failed to serialize message in send loop: {e}")
+                    batch = [await get()]
+                    while len(batch) < batch_size and not q_out.empty():
+                        batch.append(get_nowait())
+                    for frame in batch:
+                        await send(frame)
+                    debug("sent ws messages:", batch)
                 except ConnectionClosed as e:
                     await on_connection_closed(e)
                     break
@@ -104,12 +119,13 @@ async def ws_async(
                     break
 
         async def recv_loop():
+            recv, decode = ws.recv, server_msg_adapter.validate_json
             while True:
                 try:
-                    msg = await ws.recv()
-                    await q_in.put(server_msg_adapter.validate_json(msg))
+                    on_msg(decode(await recv(decode=False)))
                 except ValidationError as e:
-                    log.error(f"failed to decode server message: {e}")
+                    if error_limiter.allow(("decode", type(e))):
+                        log.error("failed to decode server message:", e.errors()[:1])
                 except ConnectionClosed as e:
                     await on_connection_closed(e)
                     break
@@ -118,8 +134,10 @@ async def ws_async(
                     break
 
         try:
+            # liveness is left to the protocol-level keepalive, the app-level
+            # ping is sent once on connect and its pong logged
+            await ws.send(PING_FRAME)
             async with asyncio.TaskGroup() as tg:
-                tg.create_task(send_heartbeat())
                 tg.create_task(send_loop())
                 tg.create_task(recv_loop())
         except* Exception as e:
@@ -139,36 +157,134 @@ class RatesConventions(Widget, can_focus=True):
     DEFAULT_CLASSES = "box conventions-grid"
     BORDER_TITLE = "Rates & Conventions"
 
-    rates: reactive[Optional[Rates]] = reactive(None, recompose=True)
-    conventions: reactive[Optional[Conventions]] = reactive(None, recompose=True)
+    rates: reactive[Optional[Rates]] = reactive(None)
+    conventions: reactive[Optional[Conventions]] = reactive(None)
     selected_libor: reactive[Optional[str]] = reactive(None)
     selected_swap: reactive[Optional[str]] = reactive(None)
 
+    Row = Tuple[Text, Any]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.libor_options: List[Tuple[str, str]] = []
+        self.swap_options: List[Tuple[str, str]] = []
+        self.libor_rows: Dict[str, List[RatesConventions.Row]] = {}
+        self.swap_rows: Dict[str, List[RatesConventions.Row]] = {}
+
+    _libor_shown: Optional[List[Row]] = None
+    _swap_shown: Optional[List[Row]] = None
+    _libor_select: Optional[RateSelect] = None
+    _swap_select: Optional[RateSelect] = None
+    _libor_table: Optional[DataTable] = None
+    _swap_table: Optional[DataTable] = None
+    _libor_label: Optional[Label] = None
+    _swap_label: Optional[Label] = None
+
+    @staticmethod
+    def _display_value(value: Any) -> Any:
+        match value:
+            case Enum():
+                return value.value
+            case dtos.Curve(name=name):
+                return name
+            case str() | int() | float():
+                return value
+            case _:
+                return str(value)
+
+    _labels: Dict[str, Text] = {}
+
+    @classmethod
+    def _label(cls, name: str) -> Text:
+        if (label := cls._labels.get(name)) is None:
+            label = cls._labels[name] = Text(name, style="italic")
+        return label
+
+    @classmethod
+    def _styled_rows(cls, conventions: dtos.Dto) -> List[Row]:
+        return [
+            (cls._label(name), cls._display_value(getattr(conventions, name)))
+            for name in type(conventions).model_fields
+        ]
+
+    @classmethod
+    def _rows(
+        cls, cache: Dict[str, List[Row]], rates: Dict[str, Any], name: str
+    ) -> Optional[List[Row]]:
+        if (rows := cache.get(name)) is None and (rate := rates.get(name)) is not None:
+            rows = cache[name] = cls._styled_rows(rate.to_conventions())
+        return rows
+
+    def watch_rates(self, rates: Optional[Rates]) -> None:
+        self.libor_options, self.swap_options = [], []
+        self.libor_rows, self.swap_rows = {}, {}
+        if rates is not None:
+            self.libor_options = [(k, k) for k in rates.libor_rates]
+            self.swap_options = [(k, k) for k in rates.swap_rates]
+        # children are only composed when rates first arrive (or go away),
+        # later updates swap the select options and table rows in place
+        if (rates is None) != (self._libor_select is None):
+            self.refresh(recompose=True)
+        elif self._libor_select is not None and self._swap_select is not None:
+            self._libor_select.set_options(self.libor_options)
+            self._swap_select.set_options(self.swap_options)
+            self.fill_libor_table()
+            self.fill_swap_table()
+
+    @staticmethod
+    def _convention_labels(conventions: Optional[Conventions]) -> Tuple[str, str]:
+        libor, swap = "-", "-"
+        if conventions is not None:
+            libor = conventions.conventions.libor_rate[0]
+            swap = conventions.conventions.swap_rate[0]
+        return (
+            f"[b $primary]●[dim] Libor Convention:[/] {libor}[/]",
+            f"[b $primary]●[dim] Swap Convention:[/] {swap}[/]",
+        )
+
+    def watch_conventions(self, conventions: Optional[Conventions]) -> None:
+        libor_label, swap_label = self._convention_labels(conventions)
+        if self._libor_label is not None and self._swap_label is not None:
+            self._libor_label.update(libor_label)
+            self._swap_label.update(swap_label)
+
+    def _update_table(self, table: DataTable, rows: List[Row]) -> None:
+        with self.app.batch_update():
+            if not table.columns:
+                table.add_column("data", key="data")
+                table.add_column("value", key="value")
+            names = {label.plain for label, _ in rows}
+            for row_key in [k for k in table.rows if k.value not in names]:
+                table.remove_row(row_key)
+            for label, value in rows:
+                if label.plain not in table.rows:
+                    table.add_row(label, value, key=label.plain)
+                elif table.get_cell(label.plain, "value") != value:
+                    table.update_cell(label.plain, "value", value, update_width=True)
+
     def fill_libor_table(self):
-        if self.rates is not None and self.selected_libor is not None:
-            libor = self.rates.libor_rates.get(self.selected_libor)
-            if libor is not None:
-                libor_table = self.query_one("#libor-table", DataTable)
-                libor_table.clear()
-                libor_table.add_columns("data", "value")
-                dikt = libor.to_conventions().model_dump(mode="json")
-                dikt["reset_curve"] = dikt["reset_curve"]["name"]
-                for row in dikt.items():
-                    styled_row = (Text(str(row[0]), style="italic"), row[1])
-                    libor_table.add_row(*styled_row)
+        if self.selected_libor is not None and self.rates is not None:
+            rows = self._rows(
+                self.libor_rows, self.rates.libor_rates, self.selected_libor
+            )
+            if (
+                rows is not None
+                and rows is not self._libor_shown
+                and self._libor_table is not None
+            ):
+                self._libor_shown = rows
+                self._update_table(self._libor_table, rows)
 
     def fill_swap_table(self):
-        if self.rates is not None and self.selected_swap is not None:
-            swap = self.rates.swap_rates.get(self.selected_swap)
-            if swap is not None:
-                swap_table = self.query_one("#swap-table", DataTable)
-                swap_table.clear()
-                swap_table.add_columns("data", "value")
-                dikt = swap.to_conventions().model_dump(mode="json")
-                dikt["discount_curve"] = dikt["discount_curve"]["name"]
-                for row in dikt.items():
-                    styled_row = (Text(str(row[0]), style="italic"), row[1])
-                    swap_table.add_row(*styled_row)
+        if self.selected_swap is not None and self.rates is not None:
+            rows = self._rows(self.swap_rows, self.rates.swap_rates, self.selected_swap)
+            if (
+                rows is not None
+                and rows is not self._swap_shown
+                and self._swap_table is not None
+            ):
+                self._swap_shown = rows
+                self._update_table(self._swap_table, rows)
 
     def watch_selected_libor(self) -> None:
         self.fill_libor_table()
@@ -177,38 +293,43 @@ class RatesConventions(Widget, can_focus=True):
         self.fill_swap_table()
 
     def compose(self) -> ComposeResult:
-        if (rates := self.rates) is not None and (
-            conventions := self.conventions
-        ) is not None:
-            yield RateSelect(
-                options=[(k, k) for k in rates.libor_rates.keys()],
+        # recompose mounts empty tables
+        self._libor_shown = self._swap_shown = None
+        self._libor_select = self._swap_select = None
+        self._libor_table = self._swap_table = None
+        self._libor_label = self._swap_label = None
+        if self.rates is not None:
+            self._libor_select = RateSelect(
+                options=self.libor_options,
                 id="libor-select",
                 allow_blank=False,
             )
-            yield RateSelect(
-                options=[(k, k) for k in rates.swap_rates.keys()],
+            self._swap_select = RateSelect(
+                options=self.swap_options,
                 id="swap-select",
                 allow_blank=False,
             )
-            yield DataTable(id="libor-table", show_header=False)
-            yield DataTable(id="swap-table", show_header=False)
-            cvs = conventions.conventions
-            yield Label(
-                f"[b $primary]●[dim] Libor Convention:[/] {cvs.libor_rate[0]}[/]"
-            )
-            yield Label(
-                f"[b $primary]●[dim] Swap Convention:[/] {cvs.swap_rate[0]}[/]",
-            )
+            yield self._libor_select
+            yield self._swap_select
+            self._libor_table = DataTable(id="libor-table", show_header=False)
+            self._swap_table = DataTable(id="swap-table", show_header=False)
+            yield self._libor_table
+            yield self._swap_table
+            libor_label, swap_label = self._convention_labels(self.conventions)
+            self._libor_label = Label(libor_label, id="libor-convention")
+            self._swap_label = Label(swap_label, id="swap-convention")
+            yield self._libor_label
+            yield self._swap_label
         # self.call_later(self.populate_tables)
 
     @on(Select.Changed, "#libor-select")
     def libor_selected(self, event: Select.Changed) -> None:
-        self.log.debug(f"libor selected {event.value}")
+        self.log.debug("libor selected", event.value)
         self.selected_libor = str(event.value)
 
     @on(Select.Changed, "#swap-select")
     def swap_selected(self, event: Select.Changed) -> None:
-        self.log.debug(f"swap selected {event.value}")
+        self.log.debug("swap selected", event.value)
         self.selected_swap = str(event.value)
 
 
@@ -232,19 +353,26 @@ class ArbitrageGrid(Widget, can_focus=True):
         tenor: dtos.Period
         expiry: dtos.Period
 
-    matrix: reactive[Optional[ArbitrageMatrix]] = reactive(None, recompose=True)
+    matrix: reactive[Optional[ArbitrageMatrix]] = reactive(None)
     tenors: reactive[List[dtos.Period]] = reactive([])
     expiries: reactive[List[dtos.Period]] = reactive([])
-    widgets: reactive[List[Widget]] = reactive([])
     selected_pair: reactive[Optional[Tuple[dtos.Period, dtos.Period]]] = reactive(None)
     n_cols: reactive[int] = reactive(0)
     n_rows: reactive[int] = reactive(0)
 
     Loc = Tuple[int, int]
+    Pair = Tuple[dtos.Period, dtos.Period]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._by_rate: Dict[ArbitrageGrid.Pair, dtos.ArbitrageCheck] = {}
+        self._tenor_idx: Dict[dtos.Period, int] = {}
+        self._expiry_idx: Dict[dtos.Period, int] = {}
+        self._cells: Dict[ArbitrageGrid.Pair, ArbitrageCell] = {}
 
     def _mv_curr_loc(self, func: Callable[[Loc], Loc]) -> None:
         if curr := self.selected_pair:
-            curr_loc = (self.tenors.index(curr[0]), self.expiries.index(curr[1]))
+            curr_loc = (self._tenor_idx[curr[0]], self._expiry_idx[curr[1]])
             target_loc = func(curr_loc)
             target = (self.tenors[target_loc[0]], self.expiries[target_loc[1]])
             self.selected_pair = target
@@ -273,21 +401,30 @@ class ArbitrageGrid(Widget, can_focus=True):
     def action_end_of_col(self) -> None:
         self._mv_curr_loc(lambda loc: (loc[0], len(self.expiries) - 1))
 
-    def compute_widgets(self) -> List[Widget]:
-        by_rate = {}
-        if data := self.matrix:
-            by_rate = {(t, e): v for t, e, v in data.matrix}
-        elems: list[Widget] = []
-        elems.append(EmptyCell())
-        for tenor in self.tenors:
-            elems.append(PeriodCell(tenor))
-        for expiry in self.expiries:
-            elems.append(PeriodCell(expiry))
-            for tenor in self.tenors:
-                if arb := by_rate.get((tenor, expiry)):
-                    cell = ArbitrageCell(tenor, expiry, arb, id=f"T{tenor}E{expiry}")
-                    elems.append(cell)
-        return elems
+    def _recompute_axes(self) -> None:
+        tenors: Set[dtos.Period] = set()
+        expiries: Set[dtos.Period] = set()
+        for tenor, expiry in self._by_rate:
+            tenors.add(tenor)
+            expiries.add(expiry)
+        self.tenors = sorted(tenors)
+        self.expiries = sorted(expiries)
+        self._tenor_idx = {t: i for i, t in enumerate(self.tenors)}
+        self._expiry_idx = {e: i for i, e in enumerate(self.expiries)}
+
+    # the grid is only rebuilt when its layout changes, otherwise the mounted
+    # cells are updated in place
+    def watch_matrix(self, matrix: Optional[ArbitrageMatrix]) -> None:
+        by_rate = matrix.by_rate if matrix else {}
+        if by_rate.keys() != self._by_rate.keys():
+            self._by_rate = by_rate
+            self._recompute_axes()
+            self.refresh(recompose=True)
+            return
+        self._by_rate = by_rate
+        for pair, arb in by_rate.items():
+            if (cell := self._cells.get(pair)) is not None and cell.arb != arb:
+                cell.set_arb(arb)
 
     def on_key(self, event: Key) -> None:
         if event.key == "enter" and (pair := self.selected_pair) is not None:
@@ -295,37 +432,13 @@ class ArbitrageGrid(Widget, can_focus=True):
             self.post_message(self.RateUnderlyingEntered(tenor, expiry))
 
     def watch_selected_pair(
-        self,
-        old_pair: Tuple[dtos.Period, dtos.Period],
-        new_pair: Tuple[dtos.Period, dtos.Period],
+        self, old_pair: Optional[Pair], new_pair: Optional[Pair]
     ) -> None:
-        for widget in self.widgets:
-            match widget:
-                case ArbitrageCell(tenor=tenor, expiry=expiry) if (
-                    new_pair[0] == tenor and new_pair[1] == expiry
-                ):
-                    try:
-                        old_cell = self.query_one(
-                            f"#T{old_pair[0]}E{old_pair[1]}", ArbitrageCell
-                        )
-                        old_cell.remove_class("highlighted-cell")
-                        new_cell = self.query_one(f"#T{tenor}E{expiry}", ArbitrageCell)
-                        new_cell.scroll_visible()
-                        new_cell.add_class("highlighted-cell")
-                    except Exception:
-                        pass
-
-    def compute_tenors(self) -> List[dtos.Period]:
-        if data := self.matrix:
-            return sorted(list({t for t, *_ in data.matrix}))
-        else:
-            return []
-
-    def compute_expiries(self) -> List[dtos.Period]:
-        if data := self.matrix:
-            return sorted(list({e for _, e, *_ in data.matrix}))
-        else:
-            return []
+        if old_pair is not None and (old_cell := self._cells.get(old_pair)):
+            old_cell.remove_class("highlighted-cell")
+        if new_pair is not None and (new_cell := self._cells.get(new_pair)):
+            new_cell.scroll_visible()
+            new_cell.add_class("highlighted-cell")
 
     def compute_n_cols(self) -> int:
         return len(self.tenors) + 1
@@ -334,12 +447,25 @@ class ArbitrageGrid(Widget, can_focus=True):
         return len(self.expiries) + 1
 
     def compose(self) -> ComposeResult:
-        header_widgets = self.widgets[: self.n_cols]
-        matrix_widgets = self.widgets[self.n_cols :]
+        self._cells = {}
+        header_widgets: List[Widget] = [EmptyCell()]
+        header_widgets.extend(PeriodCell(tenor) for tenor in self.tenors)
+        matrix_widgets: List[Widget] = []
+        for expiry in self.expiries:
+            matrix_widgets.append(PeriodCell(expiry))
+            for tenor in self.tenors:
+                if arb := self._by_rate.get((tenor, expiry)):
+                    cell = ArbitrageCell(tenor, expiry, arb)
+                    if (tenor, expiry) == self.selected_pair:
+                        cell.add_class("highlighted-cell")
+                    self._cells[(tenor, expiry)] = cell
+                    matrix_widgets.append(cell)
         header = Grid(*header_widgets, classes="matrix-header")
-        header.set_styles(f"grid-size: {self.n_cols};")
+        header.styles.grid_size_columns = self.n_cols
+        header.styles.grid_size_rows = 0
         body = Grid(*matrix_widgets, classes="matrix-body")
-        body.set_styles(f"grid-size: {self.n_cols} {self.n_rows};")
+        body.styles.grid_size_columns = self.n_cols
+        body.styles.grid_size_rows = self.n_rows
         with Grid(classes="matrix-grid"):
             yield header
             yield body
@@ -356,45 +482,59 @@ class DensityChart(QuotesPlot):
 class Body(Widget):
     state: reactive[Optional[State]] = reactive(None)
 
+    _rates_conventions: RatesConventions
+    _vola_skew_chart: VolaSkewChart
+    _grid: ArbitrageGrid
+    _density_chart: DensityChart
+
     def compose(self) -> ComposeResult:
+        self._rates_conventions = RatesConventions()
+        self._vola_skew_chart = VolaSkewChart()
+        self._grid = ArbitrageGrid()
+        self._density_chart = DensityChart(draw_hline_zero=True)
         yield FileBar()
-        yield RatesConventions()
-        yield VolaSkewChart()
-        yield ArbitrageGrid()
-        yield DensityChart(draw_hline_zero=True)
+        yield self._rates_conventions
+        yield self._vola_skew_chart
+        yield self._grid
+        yield self._density_chart
 
-    def watch_state(self, state: State) -> None:
+    def watch_state(self, old_state: Optional[State], state: Optional[State]) -> None:
         if not state:
             return
 
-        self.query_one(RatesConventions).rates = state.rates
-        self.query_one(RatesConventions).conventions = state.conventions
-        self.query_one(ArbitrageGrid).matrix = state.matrix
+        rates_conventions = self._rates_conventions
+        if rates_conventions.rates is not state.rates:
+            rates_conventions.rates = state.rates
+        if rates_conventions.conventions is not state.conventions:
+            rates_conventions.conventions = state.conventions
+        grid = self._grid
+        if grid.matrix is not state.matrix:
+            grid.matrix = state.matrix
+
+        old_state = old_state or State()
+        if state.samples is old_state.samples and state.matrix is old_state.matrix:
+            return
 
         if (data := state.samples) is not None and (matrix := state.matrix) is not None:
             samples = data.samples
             tenor = data.tenor
             expiry = data.expiry
-            arbitrage = next(
-                a for (t, e, a) in matrix.matrix if t == tenor and e == expiry
-            )
-            self.query_one(VolaSkewChart).state = VolaSkewChart.State(
-                [Point(*t) for t in zip(samples.quoted_strikes, samples.quoted_vols)],
-                [Point(*t) for t in zip(samples.strikes, samples.vols)],
+            arbitrage = matrix.by_rate[(tenor, expiry)]
+            self._vola_skew_chart.state = VolaSkewChart.State(
+                *data.smile_points,
                 samples.fwd,
                 tenor,
                 expiry,
                 arbitrage.arbitrage,
             )
-            self.query_one(DensityChart).state = DensityChart.State(
-                [Point(*t) for t in zip(samples.quoted_strikes, samples.quoted_pdf)],
-                [Point(*t) for t in zip(samples.strikes, samples.pdf)],
+            self._density_chart.state = DensityChart.State(
+                *data.density_points,
                 samples.fwd,
                 tenor,
                 expiry,
                 arbitrage.arbitrage,
             )
-            self.query_one(ArbitrageGrid).selected_pair = (tenor, expiry)
+            grid.selected_pair = (tenor, expiry)
 
 
 class Arbitui(App):
@@ -407,76 +547,75 @@ class Arbitui(App):
         ("a", "jump_to_matrix", "Jump to matrix"),
     ]
 
-    q_in = Queue[ServerMsg]()
-    q_out = Queue[ClientMsg]()
-    q_toast = Queue[ToastMessage]()
-    q_state_updates = Queue[Callable[[State], State]]()
+    q_out = Channel[bytes](maxsize=settings.ws_send_queue_size)
 
     state: reactive[State] = reactive(State())
 
+    SamplesRequest = Tuple[VolaCube, dtos.Period, dtos.Period]
+
+    _pending_samples_request: Optional[SamplesRequest] = None
+    _samples_timer: Optional[Timer] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_state: Dict[str, Any] = {}
+        self.server_msg_handlers: Dict[type, Callable[[Any], None]] = {
+            Pong: lambda _: log.info("pong received"),
+            Rates: lambda m: self.update_state("rates", m),
+            Conventions: lambda m: self.update_state("conventions", m),
+            ArbitrageMatrix: lambda m: self.update_state("matrix", m),
+            VolSamples: lambda m: self.update_state("samples", m),
+            VolaCube: lambda m: self.update_state("cube", m),
+            Notification: lambda m: self.notify(
+                m.msg, severity=m.severity.to_textual()
+            ),
+        }
+
     def action_jump_to_matrix(self) -> None:
         matrix = self.query_one(ArbitrageGrid)
         matrix.focus()
 
-    def update_state(self, fn: Callable[[State], State]):
+    def send(self, msg: ClientMsg):
         try:
-            self.q_state_updates.put_nowait(fn)
-        except QueueFull as e:
-            log.error(f"state update Q is full: {e}")
+            self.q_out.put_nowait(client_msg_adapter.dump_json(msg))
+        except PydanticSerializationError as e:
+            log.error(f"failed to serialize client message: {e}")
+        except QueueFull:
+            log.warning("send queue full, dropping client message:", msg.type)
+            self.notify("Server is not keeping up, request dropped", severity="warning")
+
+    def update_state(self, field: str, value: Any):
+        if not self._pending_state:
+            self.call_later(self.apply_state_updates)
+        self._pending_state[field] = value
+
+    # an exception raised here crashes the app on purpose
+    def apply_state_updates(self):
+        updates, self._pending_state = self._pending_state, {}
+        self.state = replace(self.state, **updates)
 
     async def on_mount(self) -> None:
-        self.run_worker(ws_async(self.q_in, self.q_out, self.q_toast))
-        self.run_worker(self.recv_loop())
-        self.run_worker(self.state_updates_loop())
-        self.run_worker(self.toast_loop())
+        self.run_worker(
+            ws_async(
+                self.handle_server_msg,
+                self.q_out,
+                lambda msg: self.notify(msg, severity="warning"),
+            )
+        )
         self.register_theme(rates_terminal_theme)
         self.theme = "rates-terminal"
 
-    async def toast_loop(self):
-        while True:
-            toast = await self.q_toast.get()
-            self.notify(toast.msg, severity=toast.severity)
-
-    async def recv_loop(self):
-        while True:
+    def handle_server_msg(self, msg: ServerMsg):
+        log.info("received server message:", msg.type)
+        if (handler := self.server_msg_handlers.get(type(msg))) is not None:
             try:
-                msg = await self.q_in.get()
-                await self.handle_server_msg(msg)
+                handler(msg)
             except Exception as e:
-                log.error(f"exception in loop handling server messages: {e}")
-
-    async def handle_server_msg(self, msg: ServerMsg):
-        match msg:
-            case Pong():
-                log.info("pong received")
-            case Rates() as rates:
-                log.info("updating rates state")
-                self.update_state(lambda s: replace(s, rates=rates))
-            case Conventions() as conventions:
-                log.info("updating conventions state")
-                self.update_state(lambda s: replace(s, conventions=conventions))
-            case ArbitrageMatrix() as matrix:
-                log.info("updating arbitrage matrix state")
-                self.update_state(lambda s: replace(s, matrix=matrix))
-            case VolSamples() as samples:
-                log.info("updating vol samples state")
-                self.update_state(lambda s: replace(s, samples=samples))
-            case VolaCube() as cube:
-                log.info(f"received vol cube currency {cube.currency}")
-                self.update_state(lambda s: replace(s, cube=cube))
-            case Notification(msg=msg, severity=severity):
-                await self.q_toast.put(
-                    ToastMessage(msg=msg, severity=severity.to_textual())
-                )
-
-    async def state_updates_loop(self):
-        try:
-            while True:
-                fn = await self.q_state_updates.get()
-                self.state = fn(self.state)
-        except Exception as e:
-            log.error(f"state update loop failed: {e}")
-            raise  # crash app on purpose
+                if error_limiter.allow(("handle", type(e))):
+                    log.error("exception handling server message:", e)
+        else:
+            if error_limiter.allow(("unhandled", msg.type)):
+                log.warning("no handler for server message", msg.type)
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -486,20 +625,43 @@ class Arbitui(App):
     async def on_arbitrage_grid_rate_underlying_entered(
         self, event: ArbitrageGrid.RateUnderlyingEntered
     ) -> None:
-        if cube := self.state.cube:
-            await self.q_out.put(
-                GetVolSamples(
-                    currency=cube.currency,
-                    vol_cube=cube.cube,
-                    tenor=event.tenor,
-                    expiry=event.expiry,
-                )
+        if (cube := self.state.cube) is None:
+            return
+        request = (cube, event.tenor, event.expiry)
+        pending = self._pending_samples_request
+        if pending is not None and pending[0] is cube and pending[1:] == request[1:]:
+            return
+        # rapid navigation only requests the underlying it settles on
+        if self._samples_timer is not None:
+            self._samples_timer.stop()
+        self._pending_samples_request = request
+        self._samples_timer = self.set_timer(
+            settings.vol_samples_debounce_seconds,
+            lambda: self.request_vol_samples(request),
+        )
+
+    def request_vol_samples(self, request: SamplesRequest) -> None:
+        cube, tenor, expiry = request
+        self._pending_samples_request = None
+        self._samples_timer = None
+        self.send(
+            GetVolSamples(
+                currency=cube.currency,
+                vol_cube=cube.cube,
+                tenor=tenor,
+                expiry=expiry,
             )
+        )
 
     async def on_file_input_file_changed(self, event: FileInput.FileChanged) -> None:
-        await self.q_out.put(LoadCube(file_path=event.path))
+        self.send(LoadCube(file_path=event.path))
 
 
 if __name__ == "__main__":
     app = Arbitui()
-    app.run()
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on windows
+        app.run()
+    else:
+        app.run(loop=uvloop.new_event_loop())
@@ -74,7 +74,12 @@ class Period(BaseModel):
         return f"{self.length}{self.unit.value}"
 
     def __hash__(self) -> int:
-        return self.__str__().__hash__()
+        return hash((self.length, self.unit))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Period):
+            return NotImplemented
+        return self.length == other.length and self.unit is other.unit
 
     def to_year_fraction(self) -> float:
         match self.unit:
@@ -247,6 +252,11 @@ class VolatilityCube(Dto):
     cube: dict[Period, VolatilitySurface]
 
 
+class VolatilityCubeFile(Dto):
+    currency: str
+    data: VolatilityCube
+
+
 class LiborConventions(Dto):
     currency: str
     spot_lag: int
@@ -25,7 +25,7 @@ class Handler:
         | dtos.VolSamplingParams,
         kls: Type[T],
     ) -> T:
-        logger.info(f"rpc call method: {method.value}")
+        logger.info("rpc call method: {}", method.value)
         request = RPCRequest(method=method.value, params=params, id=str(uuid.uuid4()))
         return await self.socket.call(request, kls)
 
@@ -1,10 +1,12 @@
 from enum import Enum
-from typing import Annotated, List, Literal, Tuple, Union
+from functools import cached_property
+from typing import Annotated, Dict, List, Literal, Tuple, Union
 
 from pydantic import BaseModel, Field
 from pydantic.type_adapter import TypeAdapter
 
 import dtos
+from transition import Point
 
 
 class Ping(BaseModel):
@@ -90,6 +92,10 @@ class ArbitrageMatrix(BaseModel):
     matrix: List[Tuple[dtos.Period, dtos.Period, dtos.ArbitrageCheck]]
     type: Literal["arbitrage_matrix"] = "arbitrage_matrix"
 
+    @cached_property
+    def by_rate(self) -> Dict[Tuple[dtos.Period, dtos.Period], dtos.ArbitrageCheck]:
+        return {(t, e): a for t, e, a in self.matrix}
+
 
 class ArbitrageCheck(BaseModel):
     currency: str
@@ -106,6 +112,24 @@ class VolSamples(BaseModel):
     samples: dtos.VolSampling
     type: Literal["vol_samples"] = "vol_samples"
 
+    # plot points, (quotes, interpolated), derived once per message
+
+    @cached_property
+    def smile_points(self) -> Tuple[List[Point], List[Point]]:
+        s = self.samples
+        return (
+            [Point(*t) for t in zip(s.quoted_strikes, s.quoted_vols)],
+            [Point(*t) for t in zip(s.strikes, s.vols)],
+        )
+
+    @cached_property
+    def density_points(self) -> Tuple[List[Point], List[Point]]:
+        s = self.samples
+        return (
+            [Point(*t) for t in zip(s.quoted_strikes, s.quoted_pdf)],
+            [Point(*t) for t in zip(s.strikes, s.pdf)],
+        )
+
 
 class Severity(Enum):
     INFORMATION = "information"
@@ -1,10 +1,8 @@
 import asyncio
-import json
 from asyncio.queues import Queue
 from asyncio.taskgroups import TaskGroup
 from contextlib import asynccontextmanager
 from datetime import datetime
-from json.decoder import JSONDecodeError
 from lib import Socket
 from typing import List, Tuple
 
@@ -13,7 +11,7 @@ from pydantic import ValidationError
 from pydantic_core._pydantic_core import PydanticSerializationError
 from starlette.applications import Starlette
 from starlette.routing import WebSocketRoute
-from starlette.websockets import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocket
 
 import db
 import dtos
@@ -58,13 +56,16 @@ async def websocket_endpoint(ws: WebSocket):
     await db.init_db(ctx)
 
     async def recv_loop():
-        async for js in ws.iter_json():
+        while True:
+            frame = await ws.receive()
+            if frame["type"] == "websocket.disconnect":
+                logger.info("websocket disconnected")
+                return
             try:
-                msg = client_msg_adapter.validate_python(js)
+                # binary and text frames carry the same json payload
+                raw = frame.get("bytes") or frame.get("text") or b""
+                msg = client_msg_adapter.validate_json(raw)
                 await q_in.put(msg)
-            except WebSocketDisconnect:
-                logger.exception("websocket disconnected")
-                raise
             except ValidationError as e:
                 logger.exception(f"failed to decode client message: {e}")
             except Exception as e:
@@ -75,7 +76,7 @@ async def websocket_endpoint(ws: WebSocket):
         while True:
             try:
                 msg = await q_out.get()
-                await ws.send_json(server_msg_adapter.dump_python(msg, mode="json"))
+                await ws.send_bytes(server_msg_adapter.dump_json(msg))
             except PydanticSerializationError as e:
                 logger.exception(f"failed to serialize message in send loop: {e}")
             except Exception as e:
@@ -134,17 +135,19 @@ async def websocket_endpoint(ws: WebSocket):
 
             case LoadCube(file_path=path):
                 try:
-                    with open(path) as js:
-                        cube_js = json.load(js)
-
-                    ccy = cube_js["currency"]
-                    vol = dtos.VolatilityCube.model_validate(cube_js["data"])
+                    with open(path, "rb") as js:
+                        cube_file = dtos.VolatilityCubeFile.model_validate_json(
+                            js.read()
+                        )
 
-                except ValidationError:
-                    await log_notify_error(f"failed to validate json in {path}")
+                    ccy = cube_file.currency
+                    vol = cube_file.data
 
-                except JSONDecodeError:
-                    await log_notify_error(f"failed to decode json in {path}")
+                except ValidationError as e:
+                    if any(err["type"] == "json_invalid" for err in e.errors()):
+                        await log_notify_error(f"failed to decode json in {path}")
+                    else:
+                        await log_notify_error(f"failed to validate json in {path}")
 
                 except Exception:
                     await log_notify_error(f"failed to load {path}")
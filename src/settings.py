@@ -13,6 +13,12 @@ class Settings(BaseSettings):
     vol_sampling_cache_ttl: int = 360
     bulk_arbitrage_matrix: bool = True
     ws_heartbeat_seconds: int = 3
+    ws_ping_timeout_seconds: int = 10
+    ws_send_batch_size: int = 64
+    ws_send_queue_size: int = 64
+    ws_compression: bool = False
+    ws_max_message_bytes: int = 2**24
+    vol_samples_debounce_seconds: float = 0.05
     plot_transition_duration_seconds: float = 0.10
     plot_easing_function: str = "in_out_cubic"
 
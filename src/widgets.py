@@ -116,6 +116,21 @@ class QuotesPlot(PlotextPlot, can_focus=True):
 
     prev_curr_state: Tuple[Optional[State], Optional[State]] = (None, None)
 
+    Coords = Tuple[List[float], List[float]]
+
+    _interp_src: Optional[List[Point]] = None
+    _interp_coords: Coords = ([], [])
+
+    @staticmethod
+    def _coords(points: List[Point]) -> Coords:
+        return [p.x for p in points], [p.y for p in points]
+
+    def _interp_coordinates(self, interp: List[Point]) -> Coords:
+        if interp is not self._interp_src:
+            self._interp_src = interp
+            self._interp_coords = self._coords(interp)
+        return self._interp_coords
+
     def transition_state(self, source: State, target: State, t: float) -> State:
         return self.State(
             transition(source.quotes, target.quotes, t),
@@ -138,16 +153,8 @@ class QuotesPlot(PlotextPlot, can_focus=True):
 
     def _draw_series(self, state: State) -> None:
         self.plt.clear_data()
-        self.plt.plot(
-            [p.x for p in state.interp],
-            [p.y for p in state.interp],
-            marker="braille",
-        )
-        self.plt.scatter(
-            [p.x for p in state.quotes],
-            [p.y for p in state.quotes],
-            marker="o",
-        )
+        self.plt.plot(*self._interp_coordinates(state.interp), marker="braille")
+        self.plt.scatter(*self._coords(state.quotes), marker="o")
         self.refresh()
 
     def _draw_axis(self, state: State) -> None:
@@ -228,10 +235,12 @@ class ArbitrageCell(Static):
     ):
         self.tenor = tenor
         self.expiry = expiry
-        self.arb = arb
         super().__init__(*args, **kwargs)
-
-    def on_mount(self) -> None:
-        css = "success-cell" if self.arb.arbitrage is None else "error-cell"
         self.add_class("arbitrage-cell")
-        self.add_class(css)
+        self.set_arb(arb)
+
+    def set_arb(self, arb: ArbitrageCheck) -> None:
+        self.arb = arb
+        ok = arb.arbitrage is None
+        self.set_class(ok, "success-cell")
+        self.set_class(not ok, "error-cell")